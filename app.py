@@ -21,8 +21,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS. Deliberately emitted on every run rather than once per
+# session: Streamlit removes elements a rerun doesn't emit again, so a
+# one-shot injection would drop the styles after the first slider change.
+CUSTOM_CSS = """
     <style>
     .main {
         background-color: #0e1117;
@@ -43,36 +45,85 @@ st.markdown("""
         color: #ffffff;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Constants
 TOTAL_SUPPLY = 10_000_000_000  # 10 billion
 LP_FUND_PERCENT = 0.20  # 20% of funds go to LP
 
+# (divisor, suffix) pairs, indexed by how many thousands thresholds a value crosses
+_SCALES = ((1, ""), (1_000, "K"), (1_000_000, "M"), (1_000_000_000, "B"))
+
 def format_number(num):
     """Format large numbers with commas."""
-    if num >= 1_000_000_000:
-        return f"{num / 1_000_000_000:,.2f}B"
-    elif num >= 1_000_000:
-        return f"{num / 1_000_000:,.2f}M"
-    elif num >= 1_000:
-        return f"{num / 1_000:,.2f}K"
-    else:
-        return f"{num:,.2f}"
+    divisor, suffix = _SCALES[(num >= 1_000) + (num >= 1_000_000) + (num >= 1_000_000_000)]
+    return f"{num / divisor:,.2f}{suffix}"
+
+# Validation messages indexed by (lp_ok << 1) | fdv_ok
+_VALIDATION_ERRORS = (
+    "LP cannot be 0%",
+    "LP cannot be 0%",
+    "LP FDV would drop below ICO FDV",
+    "",
+)
 
+@st.cache_data
 def validate_allocation(team_percent, public_percent):
     """Check if allocation is valid"""
     lp_percent = 100 - team_percent - public_percent
     
-    # LP must be > 0
-    if lp_percent < 0.1:
-        return False, lp_percent, "LP cannot be 0%"
+    # LP must be > 0, and LP FDV >= ICO FDV (unless public is negligible)
+    lp_ok = lp_percent >= 0.1
+    fdv_ok = (public_percent <= 0.1) | (lp_percent <= 0.2 * public_percent)
     
-    # LP FDV >= ICO FDV constraint
-    if public_percent > 0.1 and lp_percent > 0.2 * public_percent:
-        return False, lp_percent, "LP FDV would drop below ICO FDV"
+    return lp_ok & fdv_ok, lp_percent, _VALIDATION_ERRORS[(lp_ok << 1) | fdv_ok]
+
+@st.cache_data
+def compute_economics(team_percent, public_percent, funds_to_raise):
+    """Derive token counts, fund split and FDVs from the slider values"""
+    lp_percent = 100 - team_percent - public_percent
     
-    return True, lp_percent, ""
+    # Calculate token allocations
+    team_tokens = TOTAL_SUPPLY * (team_percent / 100)
+    public_tokens = TOTAL_SUPPLY * (public_percent / 100)
+    lp_tokens = TOTAL_SUPPLY * (lp_percent / 100)
+
+    # Calculate funds distribution
+    lp_funds = funds_to_raise * LP_FUND_PERCENT
+    team_funds = funds_to_raise * (1 - LP_FUND_PERCENT)
+
+    # Calculate prices
+    if public_tokens > 0:
+        ico_price = funds_to_raise / public_tokens
+    else:
+        ico_price = 0
+
+    if lp_tokens > 0:
+        lp_price = lp_funds / lp_tokens
+    else:
+        lp_price = 0
+
+    # Calculate FDVs
+    fdv_ico = TOTAL_SUPPLY * ico_price
+    fdv_lp = TOTAL_SUPPLY * lp_price
+
+    if fdv_ico > 0:
+        fdv_multiple = fdv_lp / fdv_ico
+    else:
+        fdv_multiple = 0
+    
+    return {
+        "team_tokens": team_tokens,
+        "public_tokens": public_tokens,
+        "lp_tokens": lp_tokens,
+        "lp_funds": lp_funds,
+        "team_funds": team_funds,
+        "fdv_ico": fdv_ico,
+        "fdv_lp": fdv_lp,
+        "fdv_multiple": fdv_multiple,
+    }
 
 # Main title
 st.title("🚀 Token Economics Calculator")
@@ -133,34 +184,8 @@ if not is_valid:
     st.error(f"⚠️ Invalid Allocation: {error_msg}")
     st.stop()
 
-# Calculate token allocations
-team_tokens = TOTAL_SUPPLY * (team_percent / 100)
-public_tokens = TOTAL_SUPPLY * (public_percent / 100)
-lp_tokens = TOTAL_SUPPLY * (lp_percent / 100)
-
-# Calculate funds distribution
-lp_funds = funds_to_raise * LP_FUND_PERCENT
-team_funds = funds_to_raise * (1 - LP_FUND_PERCENT)
-
-# Calculate prices
-if public_tokens > 0:
-    ico_price = funds_to_raise / public_tokens
-else:
-    ico_price = 0
-
-if lp_tokens > 0:
-    lp_price = lp_funds / lp_tokens
-else:
-    lp_price = 0
-
-# Calculate FDVs
-fdv_ico = TOTAL_SUPPLY * ico_price
-fdv_lp = TOTAL_SUPPLY * lp_price
-
-if fdv_ico > 0:
-    fdv_multiple = fdv_lp / fdv_ico
-else:
-    fdv_multiple = 0
+# Cached per (team, public, funds), so revisited slider positions are free
+economics = compute_economics(team_percent, public_percent, funds_to_raise)
 
 # Display results in columns
 col1, col2 = st.columns(2)
@@ -170,19 +195,19 @@ with col1:
     
     st.metric(
         label="Team Tokens",
-        value=f"{format_number(team_tokens)} tokens",
+        value=f"{format_number(economics['team_tokens'])} tokens",
         delta=f"{team_percent:.1f}%"
     )
     
     st.metric(
         label="Public Sale Tokens",
-        value=f"{format_number(public_tokens)} tokens",
+        value=f"{format_number(economics['public_tokens'])} tokens",
         delta=f"{public_percent:.1f}%"
     )
     
     st.metric(
         label="LP Tokens",
-        value=f"{format_number(lp_tokens)} tokens",
+        value=f"{format_number(economics['lp_tokens'])} tokens",
         delta=f"{lp_percent:.1f}%"
     )
     
@@ -202,12 +227,12 @@ with col2:
     
     st.metric(
         label="LP Funds (20%)",
-        value=f"${format_number(lp_funds)}"
+        value=f"${format_number(economics['lp_funds'])}"
     )
     
     st.metric(
         label="Team Funds (80%)",
-        value=f"${format_number(team_funds)}"
+        value=f"${format_number(economics['team_funds'])}"
     )
 
 st.markdown("---")
@@ -220,21 +245,21 @@ col3, col4, col5 = st.columns(3)
 with col3:
     st.metric(
         label="Pre-Market FDV (ICO Price)",
-        value=f"${format_number(fdv_ico)}",
+        value=f"${format_number(economics['fdv_ico'])}",
         help="FDV at public sale price"
     )
 
 with col4:
     st.metric(
         label="Market FDV (LP Price)",
-        value=f"${format_number(fdv_lp)}",
+        value=f"${format_number(economics['fdv_lp'])}",
         help="FDV at LP price"
     )
 
 with col5:
     st.metric(
         label="FDV Multiple",
-        value=f"{fdv_multiple:.2f}x",
+        value=f"{economics['fdv_multiple']:.2f}x",
         help="Market FDV / Pre-Market FDV"
     )
 
@@ -11,9 +11,34 @@ Interactive calculator with sliders to adjust:
 20% of raised funds allocated to LP.
 """
 
+import logging
+import math
 import tkinter as tk
+from functools import lru_cache, partial
 from tkinter import ttk
 
+log = logging.getLogger(__name__)
+
+# Constants
+TOTAL_SUPPLY = 10_000_000_000  # 10 billion
+LP_FUND_PERCENT = 0.20  # 20% of funds go to LP
+
+# Lookup tables over the discrete slider domains (percent steps by 1,
+# funds by $10K), so updates index instead of recomputing
+TOKENS_FOR_PCT = [TOTAL_SUPPLY * (p / 100) for p in range(101)]
+FUNDS_TABLE = {f: (f * LP_FUND_PERCENT, f * (1 - LP_FUND_PERCENT))
+               for f in range(10_000, 2_000_001, 10_000)}
+
+# (divisor, suffix) pairs, indexed by how many thousands thresholds a value crosses
+_SCALES = ((1, ""), (1_000, "K"), (1_000_000, "M"), (1_000_000_000, "B"))
+
+
+@lru_cache(maxsize=1024)
+def format_number(num):
+    """Format large numbers with commas."""
+    divisor, suffix = _SCALES[(num >= 1_000) + (num >= 1_000_000) + (num >= 1_000_000_000)]
+    return f"{num / divisor:,.2f}{suffix}"
+
 
 class TokenEconomicsGUI:
     def __init__(self, root):
@@ -22,10 +47,6 @@ class TokenEconomicsGUI:
         self.root.geometry("950x850")
         self.root.configure(bg='#1e1e1e')
         
-        # Constants
-        self.TOTAL_SUPPLY = 10_000_000_000  # 10 billion
-        self.LP_FUND_PERCENT = 0.20  # 20% of funds go to LP
-        
         # Create main frame
         main_frame = tk.Frame(root, bg='#1e1e1e', padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -44,19 +65,25 @@ class TokenEconomicsGUI:
         self.funds_var = tk.DoubleVar(value=100_000)
         self.public_var = tk.DoubleVar(value=70)
         
+        # Pending debounced commit (after() id)
+        self._pending = None
+        
         # Team Token Allocation Slider
         self.create_slider(controls_frame, "Team Token Allocation (%)", 
-                          0, 30, 10, self.team_var, 0)
+                          0, 30, 10, self.team_var, 0,
+                          command=self._on_slider_change)
         
         # Funds to Raise Slider
         self.create_slider(controls_frame, "Funds to Raise ($)", 
                           10_000, 2_000_000, 100_000, 
                           self.funds_var, 1,
-                          format_value=self.format_currency)
+                          format_value=self.format_currency,
+                          command=self._on_slider_change)
         
         # Public Sale Token Allocation Slider
-        self.create_slider(controls_frame, "Public Sale Token Alloc (%)", 
-                          0, 100, 70, self.public_var, 2)
+        self.public_slider = self.create_slider(controls_frame, "Public Sale Token Alloc (%)", 
+                                                0, 100, 70, self.public_var, 2,
+                                                command=self._on_slider_change)
         
         # LP Allocation Display (Read-only)
         lp_frame = tk.Frame(controls_frame, bg='#2d2d2d')
@@ -70,8 +97,13 @@ class TokenEconomicsGUI:
                                        font=('Arial', 16), bg='#2d2d2d', fg='#00ff88')
         self.lp_value_label.pack(anchor='w', pady=(5, 0))
         
+        # Last colour applied to labels whose colour depends on state
+        self._last_fg = {'lp_value': '#00ff88'}
+        
+        self.lp_pb_var = tk.DoubleVar(value=20)
         self.lp_bar = ttk.Progressbar(lp_frame, length=400, mode='determinate', 
-                                      maximum=100, style='LP.Horizontal.TProgressbar')
+                                      maximum=100, variable=self.lp_pb_var,
+                                      style='LP.Horizontal.TProgressbar')
         self.lp_bar.pack(fill=tk.X, pady=(10, 0))
         
         # Results Panel with Canvas for scrolling
@@ -82,11 +114,6 @@ class TokenEconomicsGUI:
         scrollbar = tk.Scrollbar(results_container, orient="vertical", command=canvas.yview)
         results_frame = tk.Frame(canvas, bg='#2d2d2d', padx=20, pady=20)
         
-        results_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
         canvas.create_window((0, 0), window=results_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
@@ -98,33 +125,38 @@ class TokenEconomicsGUI:
         results_title.pack(pady=(0, 10))
         
         # Warning label for invalid allocation
-        self.warning_label = tk.Label(results_frame, text="", 
+        self.warning_label = tk.Label(results_frame, text="", width=64,
                                      font=('Arial', 12, 'bold'), bg='#2d2d2d', fg='#ff0000')
         self.warning_label.pack(pady=(0, 10))
         
         # Create result labels
         self.result_labels = {}
+        self._last_rendered = {}
         result_fields = [
-            ("Team Tokens", "team_tokens"),
-            ("Public Sale Tokens", "public_tokens"),
-            ("LP Tokens", "lp_tokens"),
-            ("Total Allocation %", "total_percent"),
-            ("", "divider1"),
-            ("Total Funds Raised", "total_funds"),
-            ("LP Funds (20%)", "lp_funds"),
-            ("Team Funds (80%)", "team_funds"),
-            ("", "divider2"),
-            ("Pre-Market FDV (ICO Price)", "fdv_ico"),
-            ("Market FDV (LP Price)", "fdv_lp"),
-            ("FDV Multiple", "fdv_multiple"),
+            ("Team Tokens", "team_tokens", '#ffffff'),
+            ("Public Sale Tokens", "public_tokens", '#ffffff'),
+            ("LP Tokens", "lp_tokens", '#ffffff'),
+            ("Total Allocation %", "total_percent", '#00ff88'),
+            ("", "divider1", None),
+            ("Total Funds Raised", "total_funds", '#ffffff'),
+            ("LP Funds (20%)", "lp_funds", '#ffffff'),
+            ("Team Funds (80%)", "team_funds", '#ffffff'),
+            ("", "divider2", None),
+            ("Pre-Market FDV (ICO Price)", "fdv_ico", '#00ff88'),
+            ("Market FDV (LP Price)", "fdv_lp", '#00ff88'),
+            ("FDV Multiple", "fdv_multiple", '#ffffff'),
         ]
         
-        for label_text, key in result_fields:
+        for label_text, key, fg in result_fields:
             if key.startswith("divider"):
                 separator = tk.Frame(results_frame, height=2, bg='#444444')
                 separator.pack(fill=tk.X, pady=10)
             else:
-                self.create_result_row(results_frame, label_text, key)
+                self.create_result_row(results_frame, label_text, key, fg)
+        
+        # Rows are fixed-width, so the scroll region only needs computing once
+        results_frame.update_idletasks()
+        canvas.configure(scrollregion=canvas.bbox("all"))
         
         # Configure progress bar style
         style = ttk.Style()
@@ -136,19 +168,20 @@ class TokenEconomicsGUI:
                        lightcolor='#00ff88',
                        darkcolor='#00ff88')
         
-        # Store previous valid values for validation
-        self.prev_team = self.team_var.get()
-        self.prev_public = self.public_var.get()
+        # Keep the public slider's range within the valid envelope for the current team value
+        self.team_var.trace_add('write', self._update_public_bounds)
+        self._update_public_bounds()
+        
+        # Inputs of the last rendered calculation, used to skip no-op updates
+        self._last_inputs = None
         
-        # Bind updates with validation and store trace IDs
-        self.team_trace_id = self.team_var.trace_add('write', lambda *args: self.validate_and_update('team'))
-        self.funds_trace_id = self.funds_var.trace_add('write', lambda *args: self.update_calculations())
-        self.public_trace_id = self.public_var.trace_add('write', lambda *args: self.validate_and_update('public'))
+        # Queued after_idle() id for the deferred result-row update
+        self._secondary_pending = None
         
         # Initial calculation
         self.update_calculations()
     
-    def create_slider(self, parent, label_text, from_, to, initial, variable, row, format_value=None):
+    def create_slider(self, parent, label_text, from_, to, initial, variable, row, format_value=None, command=None):
         frame = tk.Frame(parent, bg='#2d2d2d')
         frame.grid(row=row, column=0, columnspan=2, sticky='ew', pady=15)
         
@@ -169,14 +202,19 @@ class TokenEconomicsGUI:
                          variable=variable, resolution=resolution,
                          bg='#2d2d2d', fg='#ffffff', highlightthickness=0,
                          troughcolor='#1e1e1e', activebackground='#00ff88',
-                         length=400, showvalue=0)
+                         length=400, showvalue=0, command=command)
         slider.pack(fill=tk.X, pady=(10, 0))
         
+        # Commit the final value as soon as the drag ends
+        slider.bind('<ButtonRelease-1>', self._flush_pending)
+        
         # Update value label when slider moves
-        def update_label(*args):
-            value_label.config(text=self.format_value_with_func(variable.get(), format_value))
+        variable.trace_add('write', partial(self._update_value_label, variable, value_label, format_value))
         
-        variable.trace_add('write', update_label)
+        return slider
+    
+    def _update_value_label(self, variable, value_label, format_value, *args):
+        value_label.config(text=self.format_value_with_func(variable.get(), format_value))
     
     def format_value_with_func(self, value, format_func):
         if format_func:
@@ -184,9 +222,9 @@ class TokenEconomicsGUI:
         return f"{value:.1f}%"
     
     def format_currency(self, value):
-        return f"${self.format_number(value)}"
+        return f"${format_number(value)}"
     
-    def create_result_row(self, parent, label_text, key):
+    def create_result_row(self, parent, label_text, key, fg='#ffffff'):
         frame = tk.Frame(parent, bg='#2d2d2d')
         frame.pack(fill=tk.X, pady=5)
         
@@ -194,157 +232,169 @@ class TokenEconomicsGUI:
                         bg='#2d2d2d', fg='#cccccc', anchor='w')
         label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        value_label = tk.Label(frame, text="...", font=('Arial', 11, 'bold'), 
-                              bg='#2d2d2d', fg='#ffffff', anchor='e')
+        # Values are pushed through a StringVar; the colour and width are fixed
+        # per row so text changes don't propagate geometry up the widget tree
+        value_var = tk.StringVar(value="...")
+        value_label = tk.Label(frame, textvariable=value_var, font=('Arial', 11, 'bold'), 
+                              bg='#2d2d2d', fg=fg, anchor='e', width=18)
         value_label.pack(side=tk.RIGHT)
         
-        self.result_labels[key] = value_label
+        self.result_labels[key] = value_var
     
-    def format_number(self, num):
-        """Format large numbers with commas."""
-        if num >= 1_000_000_000:
-            return f"{num / 1_000_000_000:,.2f}B"
-        elif num >= 1_000_000:
-            return f"{num / 1_000_000:,.2f}M"
-        elif num >= 1_000:
-            return f"{num / 1_000:,.2f}K"
-        else:
-            return f"{num:,.2f}"
+    def _on_slider_change(self, value=None):
+        """Debounce slider moves: (re)schedule a single commit shortly after the last one"""
+        if self._pending:
+            self.root.after_cancel(self._pending)
+        self._pending = self.root.after(40, self._commit)
     
-    def validate_and_update(self, slider_type):
-        """Validate that team + public < 100, LP > 0, and LP FDV >= ICO FDV before allowing update"""
-        team_val = self.team_var.get()
+    def _flush_pending(self, event=None):
+        """Run any pending commit immediately (e.g. on mouse release)"""
+        if self._pending:
+            self.root.after_cancel(self._pending)
+            self._commit()
+    
+    def _commit(self):
+        self._pending = None
+        self.update_calculations()
+    
+    def _update_public_bounds(self, *args):
+        """Restrict the public slider to values that keep the allocation valid for the current team %.
+        
+        With lp = 100 - team - public:
+        - LP must be at least 0.1%:        public <= 100 - team - 0.1
+        - LP FDV must not drop below ICO:  lp <= 0.2 * public  ->  public >= (100 - team) / 1.2
+        """
+        remaining = 100 - int(round(self.team_var.get()))
+        min_public = -(-5 * remaining // 6)  # ceil(remaining / 1.2) in integer arithmetic
+        max_public = math.floor(remaining - 0.1)
+        self.public_slider.configure(from_=min_public, to=max_public)
+        
+        # Pull the current value into the new range if the team change pushed it out
         public_val = self.public_var.get()
-        lp_val = 100 - team_val - public_val
-        
-        is_valid = True
-        
-        # Check if LP would be negative or zero
-        if team_val + public_val >= 100:
-            is_valid = False
-        
-        # Check if LP is too small (must be at least 0.1%)
-        elif lp_val < 0.1:
-            is_valid = False
-        
-        # Check if LP FDV would drop below ICO FDV
-        # For LP FDV >= ICO FDV, we need: lp_tokens <= 0.2 * public_tokens
-        # Which means: lp_percent <= 0.2 * public_percent
-        # Also handle edge case where public is very small
-        elif public_val > 0.1 and lp_val > 0.2 * public_val:
-            is_valid = False
-        
-        # If invalid, immediately revert without updating display
-        if not is_valid:
-            # Temporarily disable trace to avoid recursive calls
-            self.team_var.trace_remove('write', self.team_trace_id)
-            self.public_var.trace_remove('write', self.public_trace_id)
-            
-            # Revert to previous valid value
-            if slider_type == 'team':
-                self.team_var.set(self.prev_team)
-            elif slider_type == 'public':
-                self.public_var.set(self.prev_public)
-            
-            # Re-enable traces
-            self.team_trace_id = self.team_var.trace_add('write', lambda *args: self.validate_and_update('team'))
-            self.public_trace_id = self.public_var.trace_add('write', lambda *args: self.validate_and_update('public'))
+        if not min_public <= public_val <= max_public:
+            self.public_var.set(min(max(public_val, min_public), max_public))
+    
+    def _set_fg(self, key, label, fg):
+        """Reconfigure a label's colour only when it actually changes"""
+        if self._last_fg.get(key) != fg:
+            label.config(fg=fg)
+            self._last_fg[key] = fg
+    
+    def update_calculations(self):
+        # Get values
+        team_percent = self.team_var.get()
+        public_percent = self.public_var.get()
+        funds_to_raise = self.funds_var.get()
+        
+        # Nothing to do if the inputs haven't changed since the last render
+        key = (team_percent, public_percent, funds_to_raise)
+        if key == self._last_inputs:
             return
+        self._last_inputs = key
         
-        # Update previous values if valid
-        self.prev_team = team_val
-        self.prev_public = public_val
+        # Drop any result-row pass still queued for older inputs; it must go before
+        # update_idletasks(), which would otherwise run it right here
+        if self._secondary_pending:
+            self.root.after_cancel(self._secondary_pending)
+            self._secondary_pending = None
         
-        # Proceed with calculation
-        self.update_calculations()
+        # LP readout first, flushed in a single redraw pass so the slider stays responsive
+        self._update_critical(team_percent, public_percent)
+        self.root.update_idletasks()
+        
+        # Result rows are deferred to the next idle slot
+        self._secondary_pending = self.root.after_idle(self._update_secondary)
     
-    def update_calculations(self):
-        try:
-            # Get values
-            team_percent = self.team_var.get()
-            public_percent = self.public_var.get()
-            funds_to_raise = self.funds_var.get()
-            
-            # Calculate LP percentage: LP = 100 - Team - Public
-            lp_percent = 100 - team_percent - public_percent
-            
-            # Calculate total allocation (should always be 100 unless negative)
-            total_percent = team_percent + public_percent + lp_percent
-            
-            # Calculate token allocations based on percentages
-            team_tokens = self.TOTAL_SUPPLY * (team_percent / 100)
-            public_tokens = self.TOTAL_SUPPLY * (public_percent / 100)
-            lp_tokens = self.TOTAL_SUPPLY * (lp_percent / 100)
-            
-            # Update LP display (should never be negative or zero due to validation)
-            # Check if we're at or very close to a constraint limit
-            at_minimum = False
-            warning_msg = ""
-            
-            # Check if LP is very small (close to 0)
-            if lp_percent < 1.0:
+    def _update_critical(self, team_percent, public_percent):
+        """Update the LP percentage, its bar and the constraint warning"""
+        # Calculate LP percentage: LP = 100 - Team - Public
+        lp_percent = 100 - team_percent - public_percent
+        
+        # Update LP display (should never be negative or zero due to validation)
+        # Check if we're at or very close to a constraint limit
+        at_minimum = False
+        warning_msg = ""
+        
+        # Check if LP is very small (close to 0)
+        if lp_percent < 1.0:
+            at_minimum = True
+            warning_msg = "⚠️ At MINIMUM: LP cannot be 0% (slider blocked)"
+        # Check if we're at the LP FDV constraint limit
+        elif public_percent > 0.1:
+            max_lp_allowed = 0.2 * public_percent
+            if abs(lp_percent - max_lp_allowed) < 0.5:  # Within 0.5% of limit
                 at_minimum = True
-                warning_msg = "⚠️ At MINIMUM: LP cannot be 0% (slider blocked)"
-            # Check if we're at the LP FDV constraint limit
-            elif public_percent > 0.1:
-                max_lp_allowed = 0.2 * public_percent
-                if abs(lp_percent - max_lp_allowed) < 0.5:  # Within 0.5% of limit
-                    at_minimum = True
-                    warning_msg = "⚠️ At MINIMUM constraint: LP FDV = ICO FDV (slider blocked)"
-            
-            if at_minimum:
-                self.lp_value_label.config(text=f"{lp_percent:.1f}% ⚠️", fg='#ffaa00')
-                self.warning_label.config(text=warning_msg)
-            else:
-                self.lp_value_label.config(text=f"{lp_percent:.1f}%", fg='#00ff88')
-                self.warning_label.config(text="")
-            self.lp_bar['value'] = max(0, lp_percent)
-            
-            # Calculate funds distribution
-            lp_funds = funds_to_raise * self.LP_FUND_PERCENT
-            team_funds = funds_to_raise * (1 - self.LP_FUND_PERCENT)
-            
-            # Calculate prices
-            if public_tokens > 0:
-                ico_price = funds_to_raise / public_tokens
-            else:
-                ico_price = 0
-            
-            if lp_tokens > 0:
-                lp_price = lp_funds / lp_tokens
-            else:
-                lp_price = 0
-            
-            # Calculate FDVs
-            fdv_ico = self.TOTAL_SUPPLY * ico_price
-            fdv_lp = self.TOTAL_SUPPLY * lp_price
-            
-            # Calculate multiple
-            if fdv_ico > 0:
-                fdv_multiple = fdv_lp / fdv_ico
-            else:
-                fdv_multiple = 0
-            
-            # Update result labels with white text
-            self.result_labels['team_tokens'].config(text=f"{self.format_number(team_tokens)} tokens", fg='#ffffff')
-            self.result_labels['public_tokens'].config(text=f"{self.format_number(public_tokens)} tokens", fg='#ffffff')
-            self.result_labels['lp_tokens'].config(text=f"{self.format_number(lp_tokens)} tokens", fg='#ffffff')
-            self.result_labels['total_percent'].config(text="100.0%", fg='#00ff88')
-            
-            self.result_labels['total_funds'].config(text=f"${self.format_number(funds_to_raise)}", fg='#ffffff')
-            self.result_labels['lp_funds'].config(text=f"${self.format_number(lp_funds)}", fg='#ffffff')
-            self.result_labels['team_funds'].config(text=f"${self.format_number(team_funds)}", fg='#ffffff')
-            
-            self.result_labels['fdv_ico'].config(text=f"${self.format_number(fdv_ico)}", fg='#00ff88')
-            self.result_labels['fdv_lp'].config(text=f"${self.format_number(fdv_lp)}", fg='#00ff88')
-            self.result_labels['fdv_multiple'].config(text=f"{fdv_multiple:.2f}x", fg='#ffffff')
-            
-            # Debug print
-            fdv_ratio = fdv_lp / fdv_ico if fdv_ico > 0 else 0
-            print(f"Team: {team_percent}%, Public: {public_percent}%, LP: {lp_percent}%, Total: 100%, FDV_ICO: ${fdv_ico:,.0f}, FDV_LP: ${fdv_lp:,.0f}, Ratio: {fdv_ratio:.2f}x")
-            
-        except Exception as e:
-            print(f"Error in calculations: {e}")
+                warning_msg = "⚠️ At MINIMUM constraint: LP FDV = ICO FDV (slider blocked)"
+        
+        if at_minimum:
+            self.lp_value_label.config(text=f"{lp_percent:.1f}% ⚠️")
+            self._set_fg('lp_value', self.lp_value_label, '#ffaa00')
+            self.warning_label.config(text=warning_msg)
+        else:
+            self.lp_value_label.config(text=f"{lp_percent:.1f}%")
+            self._set_fg('lp_value', self.lp_value_label, '#00ff88')
+            self.warning_label.config(text="")
+        self.lp_pb_var.set(max(0.0, lp_percent))
+    
+    def _update_secondary(self):
+        """Update token, funds and FDV rows for the most recently committed inputs"""
+        self._secondary_pending = None
+        team_percent, public_percent, funds_to_raise = self._last_inputs
+        
+        # Calculate LP percentage: LP = 100 - Team - Public
+        lp_percent = 100 - team_percent - public_percent
+        
+        # Calculate token allocations based on percentages
+        team_tokens = TOKENS_FOR_PCT[int(round(team_percent))]
+        public_tokens = TOKENS_FOR_PCT[int(round(public_percent))]
+        lp_tokens = TOKENS_FOR_PCT[int(round(lp_percent))]
+        
+        # Calculate funds distribution
+        lp_funds, team_funds = FUNDS_TABLE[int(round(funds_to_raise))]
+        
+        # Calculate prices
+        if public_tokens > 0:
+            ico_price = funds_to_raise / public_tokens
+        else:
+            ico_price = 0
+        
+        if lp_tokens > 0:
+            lp_price = lp_funds / lp_tokens
+        else:
+            lp_price = 0
+        
+        # Calculate FDVs
+        fdv_ico = TOTAL_SUPPLY * ico_price
+        fdv_lp = TOTAL_SUPPLY * lp_price
+        
+        # Calculate multiple
+        if fdv_ico > 0:
+            fdv_multiple = fdv_lp / fdv_ico
+        else:
+            fdv_multiple = 0
+        
+        # Update result labels, skipping rows whose text is unchanged since the last render
+        rendered = {
+            'team_tokens': f"{format_number(team_tokens)} tokens",
+            'public_tokens': f"{format_number(public_tokens)} tokens",
+            'lp_tokens': f"{format_number(lp_tokens)} tokens",
+            'total_percent': "100.0%",
+            'total_funds': f"${format_number(funds_to_raise)}",
+            'lp_funds': f"${format_number(lp_funds)}",
+            'team_funds': f"${format_number(team_funds)}",
+            'fdv_ico': f"${format_number(fdv_ico)}",
+            'fdv_lp': f"${format_number(fdv_lp)}",
+            'fdv_multiple': f"{fdv_multiple:.2f}x",
+        }
+        for key, text in rendered.items():
+            if self._last_rendered.get(key) != text:
+                self.result_labels[key].set(text)
+                self._last_rendered[key] = text
+        
+        # Debug log (arguments are only formatted when DEBUG is enabled)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Team: %s%%, Public: %s%%, LP: %s%%, Total: 100%%, FDV_ICO: $%.0f, FDV_LP: $%.0f, Ratio: %.2fx",
+                      team_percent, public_percent, lp_percent, fdv_ico, fdv_lp, fdv_multiple)
 
 
 def main():